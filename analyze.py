@@ -10,12 +10,19 @@ accessibility flags) in Sections 6 and 11 for MeMe's GS 7.x and 8.x evaluation.
 CeCe extracts. She does not evaluate or judge. That's MeMe's job.
 """
 
+import glob
+import html
+import io
 import os
 import re
 import sys
 import zipfile
 import xml.etree.ElementTree as ET
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext, redirect_stdout
 from datetime import datetime
+from functools import lru_cache
 
 
 # ─────────────────────────────────────────────────────────────
@@ -36,19 +43,110 @@ MEDIA_KEYWORDS = [
     'recording-a-', 'uploading-a-', 'downloading-', 'installing-'
 ]
 
+# Link text that says nothing about the destination (QM 8.3).
+BAD_LINK_TEXTS = frozenset({'click here', 'here', 'link', 'read more', 'more', 'this'})
+
+# Markdown table cells: a stray pipe or newline would break the row.
+_CELL_TRANS = str.maketrans({'|': '/', '\n': ' '})
+
+
+# ─────────────────────────────────────────────────────────────
+#  REGEX PATTERNS
+# ─────────────────────────────────────────────────────────────
+# Compiled once at import; every parser below runs per file or per item.
+
+def _tag_re(tag, allow_empty=False):
+    body = '.*?' if allow_empty else '.+?'
+    return re.compile(rf'<{tag}>({body})</{tag}>', re.DOTALL)
+
+
+def _fields_re(*tags):
+    return re.compile(rf'<({"|".join(tags)})>(.+?)</\1>', re.DOTALL)
+
+
+# Script/style blocks and ordinary tags are removed in one pass.
+_RE_MARKUP = re.compile(r'<(script|style)[^>]*>.*?</(?:script|style)>|<[^>]+>', re.DOTALL)
+_RE_WS     = re.compile(r'\s+')
+
+# One automaton pass over a page name instead of an `in` probe per keyword.
+_RE_MEDIA = re.compile('|'.join(map(re.escape, MEDIA_KEYWORDS)))
+
+_RE_HEADING = re.compile(r'<h([1-6])[^>]*>(.*?)</h\1>', re.DOTALL | re.IGNORECASE)
+_RE_LINK    = re.compile(r'<a\s[^>]*href=["\']([^"\']+)["\'][^>]*>(.*?)</a>', re.DOTALL | re.IGNORECASE)
+_RE_IMG     = re.compile(r'<img\s[^>]*>', re.IGNORECASE)
+_RE_ALT     = re.compile(r'\salt=["\']([^"\']*)["\']', re.IGNORECASE)
+_RE_SRC     = re.compile(r'\ssrc=["\']([^"\']+)["\']', re.IGNORECASE)
+
+_RE_MODULE_ITEM    = re.compile(r'<item\s+identifier=[^>]+>(.*?)</item>', re.DOTALL)
+_RE_MODULE_START   = re.compile(r'<module\s+identifier=[^>]+>')
+_RE_GROUP_START    = re.compile(r'<assignmentGroup\s+identifier=[^>]+>')
+_RE_RESOURCE_START = re.compile(r'<resource\s')
+_RE_IDENT_ATTR     = re.compile(r'identifier=["\']([^"\']+)["\']')
+_RE_HREF_ATTR      = re.compile(r'href=["\']([^"\']+)["\']')
+_RE_TYPE_ATTR      = re.compile(r'type=["\']([^"\']+)["\']')
+
+_RE_TITLE         = _tag_re('title')
+_RE_WORKFLOW      = _tag_re('workflow_state')
+_RE_POSITION      = _tag_re('position')
+_RE_ITEMS_SECTION = _tag_re('items', allow_empty=True)
+_RE_BLTI_TITLE    = _tag_re('blti:title')
+_RE_BLTI_URL      = _tag_re('blti:launch_url')
+
+# Sibling fields pulled from one block in a single scan (see _first_fields)
+_RE_ITEM_FIELDS   = _fields_re('identifierref', 'workflow_state', 'title', 'content_type')
+_RE_ASSIGN_FIELDS = _fields_re('workflow_state', 'due_at', 'points_possible',
+                               'submission_types', 'title')
+_RE_GROUP_FIELDS  = _fields_re('title', 'group_weight', 'position')
+
+_IDENTITY_TAGS = [(_tag_re('title'), 'title'), (_tag_re('course_code'), 'code'),
+                  (_tag_re('start_at'), 'start_date'), (_tag_re('conclude_at'), 'end_date')]
+
+_RE_WEEK  = re.compile(r'week\s+(\d+)\s*(?:[|:—\-]\s*(.+))?', re.IGNORECASE)
+
+_RE_XMLNS_DECL   = re.compile(r'\sxmlns(?::\w+)?\s*=\s*["\'][^"\']*["\']')
+_RE_TAG_PREFIX   = re.compile(r'<(/?)[\w]+:')
+_RE_PREFIXED_ATTR = re.compile(r'\s\w+:\w+\s*=\s*["\'][^"\']*["\']')
+
+# Rubric regex fallback: fields may legitimately be empty here.
+_RE_RB_RUBRIC    = _tag_re('rubric', allow_empty=True)
+_RE_RB_TITLE     = _tag_re('title', allow_empty=True)
+_RE_RB_POINTS_PP = _tag_re('points_possible', allow_empty=True)
+_RE_RB_CRITERIA  = _tag_re('criteria', allow_empty=True)
+_RE_RB_CRITERION = _tag_re('criterion', allow_empty=True)
+_RE_RB_DESC      = _tag_re('description', allow_empty=True)
+_RE_RB_LONG_DESC = _tag_re('long_description', allow_empty=True)
+_RE_RB_POINTS    = _tag_re('points', allow_empty=True)
+_RE_RB_RATINGS   = _tag_re('ratings', allow_empty=True)
+_RE_RB_RATING    = _tag_re('rating', allow_empty=True)
+
 
 # ─────────────────────────────────────────────────────────────
 #  UTILITY
 # ─────────────────────────────────────────────────────────────
 
+def _strip_html(html_content):
+    text = _RE_MARKUP.sub(' ', html_content)
+    text = html.unescape(text)
+    return _RE_WS.sub(' ', text).strip()
+
+
+_strip_html_cached = lru_cache(maxsize=4096)(_strip_html)
+
+
 def strip_html(html_content):
-    html_content = re.sub(r'<(script|style)[^>]*>.*?</(script|style)>',
-                          '', html_content, flags=re.DOTALL)
-    text = re.sub(r'<[^>]+>', ' ', html_content)
-    for entity, char in [('&nbsp;',' '),('&amp;','&'),('&lt;','<'),
-                          ('&gt;','>'),('&quot;','"'),('&#39;',"'")]:
-        text = text.replace(entity, char)
-    return re.sub(r'\s+', ' ', text).strip()
+    # Titles, link text and headings repeat heavily across a course, so short
+    # fragments are memoized. Whole pages bypass the cache so it never pins
+    # large documents in memory.
+    if len(html_content) <= 2048:
+        return _strip_html_cached(html_content)
+    return _strip_html(html_content)
+
+
+def _safe_cell(text):
+    # Most cells contain neither character, so skip the translate copy.
+    if '|' in text or '\n' in text:
+        return text.translate(_CELL_TRANS)
+    return text
 
 
 def extract_html_metadata(raw_html):
@@ -68,14 +166,14 @@ def extract_html_metadata(raw_html):
         return meta
 
     # Extract headings with level
-    for m in re.finditer(r'<h([1-6])[^>]*>(.*?)</h\1>', raw_html, re.DOTALL | re.IGNORECASE):
+    for m in _RE_HEADING.finditer(raw_html):
         level = int(m.group(1))
         text = strip_html(m.group(2)).strip()
         if text:
             meta['headings'].append((level, text))
 
     # Extract links with URL and display text
-    for m in re.finditer(r'<a\s[^>]*href=["\']([^"\']+)["\'][^>]*>(.*?)</a>', raw_html, re.DOTALL | re.IGNORECASE):
+    for m in _RE_LINK.finditer(raw_html):
         url = m.group(1).strip()
         text = strip_html(m.group(2)).strip()
         if url and not url.startswith('#') and not url.startswith('javascript:'):
@@ -83,13 +181,13 @@ def extract_html_metadata(raw_html):
             meta['links'].append((display, url))
 
     # Extract images with alt text
-    for m in re.finditer(r'<img\s[^>]*?(?:alt=["\']([^"\']*)["\'])?[^>]*?(?:src=["\']([^"\']+)["\'])?[^>]*?/?>', raw_html, re.IGNORECASE):
-        alt = m.group(1) if m.group(1) is not None else None
-        src = m.group(2) or ''
-        # Also try reverse order (src before alt)
-        if alt is None:
-            alt_m = re.search(r'alt=["\']([^"\']*)["\']', m.group(0), re.IGNORECASE)
-            alt = alt_m.group(1) if alt_m else None
+    # Match each <img> tag once, then read alt/src from it in either order
+    for m in _RE_IMG.finditer(raw_html):
+        tag   = m.group(0)
+        alt_m = _RE_ALT.search(tag)
+        src_m = _RE_SRC.search(tag)
+        alt = alt_m.group(1) if alt_m else None
+        src = src_m.group(1) if src_m else ''
         src_snippet = src.split('/')[-1][:40] if src else '[unknown]'
 
         if alt is None:
@@ -113,9 +211,8 @@ def extract_html_metadata(raw_html):
                     f'Heading level skipped: h{levels[i-1]} → h{levels[i]} ("{meta["headings"][i][1][:30]}")')
 
     # Check for non-descriptive link text
-    bad_link_texts = {'click here', 'here', 'link', 'read more', 'more', 'this'}
     for text, url in meta['links']:
-        if text.lower().strip() in bad_link_texts:
+        if text.lower().strip() in BAD_LINK_TEXTS:
             meta['accessibility_notes'].append(f'Non-descriptive link text: "{text}" → {url[:60]}')
 
     return meta
@@ -158,8 +255,13 @@ def format_metadata_block(meta):
     return '\n'.join(lines) if lines else ''
 
 
+def read_zip_text(z, name):
+    """Read a zip member as UTF-8 text."""
+    return z.read(name).decode('utf-8', errors='ignore')
+
+
 def is_media_page(page_name):
-    return any(k in page_name.lower() for k in MEDIA_KEYWORDS)
+    return _RE_MEDIA.search(page_name.lower()) is not None
 
 
 def clean_assignment_name(folder_id, file_name):
@@ -167,6 +269,18 @@ def clean_assignment_name(folder_id, file_name):
     return ' '.join(w.capitalize() for w in name.split())
 
 
+@lru_cache(maxsize=None)
+def item_type_label(content_type):
+    """Map a Canvas content_type to the short label shown in Section 4."""
+    return (content_type.replace('WikiPage', 'Page')
+            .replace('DiscussionTopic', 'Discussion')
+            .replace('Quizzes::Quiz', 'Quiz')
+            .replace('ContextModuleSubHeader', 'Header')
+            .replace('ExternalUrl', 'External Link')
+            .replace('ContextExternalTool', 'LTI Tool'))
+
+
+@lru_cache(maxsize=512)
 def format_due_date(iso_string):
     if not iso_string:
         return 'Not set'
@@ -177,6 +291,7 @@ def format_due_date(iso_string):
         return iso_string
 
 
+@lru_cache(maxsize=16)
 def is_published_state(workflow_state):
     return workflow_state.lower().strip() in ('active', 'published', '')
 
@@ -185,25 +300,57 @@ def is_published_state(workflow_state):
 #  PUBLISH STATE RESOLVER
 # ─────────────────────────────────────────────────────────────
 
-def build_published_file_set(module_meta_xml, manifest_xml):
-    item_states = {}
-    item_blocks = re.split(r'<item\s+identifier=[^>]+>', module_meta_xml)[1:]
-    for block in item_blocks:
-        ref_m   = re.search(r'<identifierref>(.+?)</identifierref>', block, re.DOTALL)
-        state_m = re.search(r'<workflow_state>(.+?)</workflow_state>', block, re.DOTALL)
-        if ref_m:
-            ref   = ref_m.group(1).strip()
-            state = state_m.group(1).strip() if state_m else 'active'
-            if ref not in item_states or is_published_state(state):
-                item_states[ref] = state
-
+def _iter_blocks(start_re, text):
+    """
+    Yield the text following each `start_re` match up to the next match — a lazy
+    re.split(...)[1:] that only holds one block at a time.
+    """
+    prev = None
+    for m in start_re.finditer(text):
+        if prev is not None:
+            yield text[prev:m.start()]
+        prev = m.end()
+    if prev is not None:
+        yield text[prev:]
+
+
+def _first_fields(fields_re, xml):
+    """Collect sibling <tag>value</tag> fields in one scan (first occurrence wins)."""
+    fields = {}
+    for tag, value in fields_re.findall(xml):
+        fields.setdefault(tag, value)
+    return fields
+
+
+def _module_item_refs(module_meta_xml):
+    """(identifierref, workflow_state) for each module item that points at a resource."""
+    refs = []
+    for m in _RE_MODULE_ITEM.finditer(module_meta_xml):
+        fields = _first_fields(_RE_ITEM_FIELDS, m.group(1))
+        if 'identifierref' in fields:
+            refs.append((fields['identifierref'].strip(),
+                         fields.get('workflow_state', 'active').strip()))
+    return refs
+
+
+def _resource_hrefs(manifest_xml):
+    """Map manifest resource identifier → href."""
     id_to_href = {}
-    resource_blocks = re.split(r'<resource\s', manifest_xml)[1:]
-    for block in resource_blocks:
-        id_m   = re.search(r'identifier=["\']([^"\']+)["\']', block)
-        href_m = re.search(r'href=["\']([^"\']+)["\']', block)
+    for block in _iter_blocks(_RE_RESOURCE_START, manifest_xml):
+        id_m   = _RE_IDENT_ATTR.search(block)
+        href_m = _RE_HREF_ATTR.search(block)
         if id_m and href_m:
             id_to_href[id_m.group(1)] = href_m.group(1)
+    return id_to_href
+
+
+def build_published_file_set(module_meta_xml, manifest_xml):
+    item_states = {}
+    for ref, state in _module_item_refs(module_meta_xml):
+        if ref not in item_states or is_published_state(state):
+            item_states[ref] = state
+
+    id_to_href = _resource_hrefs(manifest_xml)
 
     published_hrefs = set()
     for ref, state in item_states.items():
@@ -217,11 +364,95 @@ def build_published_file_set(module_meta_xml, manifest_xml):
 #  IMSCC READER
 # ─────────────────────────────────────────────────────────────
 
-def read_imscc(file_path, file_bytes=None, syllabus_text=''):
-    import io
+def _read_wiki_page(z, page_path):
+    """Read and strip one wiki page. Returns (raw, clean), or None if unreadable."""
+    try:
+        raw = read_zip_text(z, page_path)
+        return raw, strip_html(raw).strip()
+    except Exception:
+        return None
+
+
+def _read_assignment(z, assign_path, files_set):
+    """
+    Read one assignment and its settings. Returns ('published', name, record),
+    ('unpublished', name, None), or None when it has no usable content.
+    """
+    try:
+        parts     = assign_path.split('/')
+        folder_id = parts[0]
+        file_name = parts[-1]
+        settings_path = f"{folder_id}/assignment_settings.xml"
+        published = True
+        due_date = 'Not set'
+        points = 'Not specified'
+        sub_type = 'Not specified'
+        clean_name = clean_assignment_name(folder_id, file_name)
+
+        if settings_path in files_set:
+            fields = _first_fields(_RE_ASSIGN_FIELDS, read_zip_text(z, settings_path))
+            if 'workflow_state' in fields:
+                published = is_published_state(fields['workflow_state'])
+            if 'due_at' in fields:
+                due_date = format_due_date(fields['due_at'].strip())
+            if 'points_possible' in fields:
+                points = fields['points_possible'].strip()
+            if 'submission_types' in fields:
+                sub_type = strip_html(fields['submission_types']).strip()
+            if 'title' in fields:
+                clean_name = strip_html(fields['title']).strip()
+
+        if not published:
+            return 'unpublished', clean_name, None
+
+        raw_html     = read_zip_text(z, assign_path)
+        instructions = strip_html(raw_html).strip()
+        if instructions:
+            return 'published', clean_name, {
+                'instructions': instructions, 'due_date': due_date,
+                'points': points, 'sub_type': sub_type, 'folder_id': folder_id,
+                'instructions_raw': raw_html,
+            }
+    except Exception:
+        pass
+    return None
+
+
+def _read_assessment(z, assess_path, files_set):
+    """
+    Read one quiz. Returns ('published', name, text), ('unpublished', None, None),
+    or None when it has no usable content.
+    """
+    try:
+        folder_id     = assess_path.split('/')[0]
+        settings_path = f"{folder_id}/assessment_meta.xml"
+        published     = True
+        if settings_path in files_set:
+            xml     = read_zip_text(z, settings_path)
+            state_m = _RE_WORKFLOW.search(xml)
+            if state_m: published = is_published_state(state_m.group(1))
+        if not published:
+            return 'unpublished', None, None
+        raw   = read_zip_text(z, assess_path)
+        clean = strip_html(raw).strip()
+        if clean:
+            return 'published', assess_path.split('/')[-2], clean[:2000]
+    except Exception:
+        pass
+    return None
+
+
+def read_imscc(file_path, file_bytes=None, syllabus_text='', workers=None, log=print):
     display_name = os.path.basename(file_path) if file_path else "uploaded file"
-    print(f"\n📂 Opening: {display_name}")
-    zip_source = io.BytesIO(file_bytes) if file_bytes is not None else file_path
+    log(f"\n📂 Opening: {display_name}")
+    # file_bytes may be raw bytes or a seekable binary file object (such as an
+    # upload buffer), which zipfile reads in place without another full copy.
+    if file_bytes is None:
+        zip_source = file_path
+    elif isinstance(file_bytes, (bytes, bytearray)):
+        zip_source = io.BytesIO(file_bytes)
+    else:
+        zip_source = file_bytes
 
     data = {
         'file_name':          display_name,
@@ -243,10 +474,33 @@ def read_imscc(file_path, file_bytes=None, syllabus_text=''):
         'publish_stats':      {},
     }
 
-    with zipfile.ZipFile(zip_source, 'r') as z:
+    # Member reads (inflate + decode + strip) run on a thread pool of `workers`
+    # threads (default: one per CPU); zlib releases the GIL while inflating.
+    # Results are merged here in archive order. With one worker, e.g. inside a
+    # --jobs process, members are read inline and no pool is started.
+    workers = workers or os.cpu_count() or 1
+    with zipfile.ZipFile(zip_source, 'r') as z, \
+            (ThreadPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()) as pool:
+        pmap = pool.map if pool is not None else map
         data['all_files'] = z.namelist()
         files = data['all_files']
-        print(f"   Total files in package: {len(files)}")
+        files_set = frozenset(files)
+        log(f"   Total files in package: {len(files)}")
+
+        # Classify every archive path in a single pass over the namelist
+        lti_files, wiki_files, assign_html_files, assess_files = [], [], [], []
+        for f in files:
+            f_lower = f.lower()
+            if 'basiclti' in f_lower or 'blti' in f_lower:
+                lti_files.append(f)
+            if 'assessment_qti.xml' in f:
+                assess_files.append(f)
+            if f.endswith('.html'):
+                if f.startswith('wiki_content/'):
+                    wiki_files.append(f)
+                elif (not f.startswith('web_resources/') and 'syllabus' not in f_lower
+                      and '/' in f):
+                    assign_html_files.append(f)
 
         for path, key in [
             ('course_settings/course_settings.xml',   'course_settings'),
@@ -255,51 +509,56 @@ def read_imscc(file_path, file_bytes=None, syllabus_text=''):
             ('course_settings/rubrics.xml',           'rubrics'),
             ('imsmanifest.xml',                       'manifest'),
         ]:
-            if path in files:
-                data[key] = z.read(path).decode('utf-8', errors='ignore')
+            if path in files_set:
+                data[key] = read_zip_text(z, path)
 
         if syllabus_text:
             data['syllabus_text'] = syllabus_text.strip()
-            print(f'   Syllabus: {len(syllabus_text):,} chars provided by user')
+            log(f'   Syllabus: {len(syllabus_text):,} chars provided by user')
         else:
-            print('   Syllabus: not provided — will be requested by MeMe')
+            log('   Syllabus: not provided — will be requested by MeMe')
 
         published_hrefs, item_states, id_to_href = build_published_file_set(
             data['module_meta'], data['manifest']
         )
 
         # LTI tools from manifest
-        for block in re.split(r'<resource\s', data['manifest'])[1:]:
-            type_m = re.search(r'type=["\']([^"\']+)["\']', block)
+        for block in _iter_blocks(_RE_RESOURCE_START, data['manifest']):
+            type_m = _RE_TYPE_ATTR.search(block)
             if type_m and ('basiclti' in type_m.group(1).lower()
                            or 'imsbasiclti' in type_m.group(1).lower()):
-                title_m = re.search(r'<title>(.+?)</title>', block, re.DOTALL)
-                url_m   = re.search(r'<blti:launch_url>(.+?)</blti:launch_url>', block, re.DOTALL)
+                title_m = _RE_TITLE.search(block)
+                url_m   = _RE_BLTI_URL.search(block)
                 tool_name = strip_html(title_m.group(1)).strip() if title_m else 'Unknown LTI Tool'
                 tool_url  = url_m.group(1).strip() if url_m else ''
                 data['lti_tools'].append({'name': tool_name, 'url': tool_url})
 
         # LTI from standalone files
-        for f in files:
-            if 'basiclti' in f.lower() or 'blti' in f.lower():
-                try:
-                    xml = z.read(f).decode('utf-8', errors='ignore')
-                    title_m = re.search(r'<blti:title>(.+?)</blti:title>', xml, re.DOTALL)
-                    url_m   = re.search(r'<blti:launch_url>(.+?)</blti:launch_url>', xml, re.DOTALL)
-                    if title_m:
-                        name = strip_html(title_m.group(1)).strip()
-                        url  = url_m.group(1).strip() if url_m else ''
-                        if not any(t['name'] == name for t in data['lti_tools']):
-                            data['lti_tools'].append({'name': name, 'url': url})
-                except Exception:
-                    pass
+        seen_tools = {t['name'] for t in data['lti_tools']}
+        for f in lti_files:
+            try:
+                # Cheap C-level byte probe before paying for the decode
+                raw = z.read(f)
+                if b'<blti:title>' not in raw:
+                    continue
+                xml = raw.decode('utf-8', errors='ignore')
+                title_m = _RE_BLTI_TITLE.search(xml)
+                url_m   = _RE_BLTI_URL.search(xml)
+                if title_m:
+                    name = strip_html(title_m.group(1)).strip()
+                    url  = url_m.group(1).strip() if url_m else ''
+                    if name not in seen_tools:
+                        seen_tools.add(name)
+                        data['lti_tools'].append({'name': name, 'url': url})
+            except Exception:
+                pass
 
         if data['lti_tools']:
-            print(f"   LTI tools detected: {len(data['lti_tools'])}")
+            log(f"   LTI tools detected: {len(data['lti_tools'])}")
 
         # Wiki pages
-        wiki_files = [f for f in files if f.startswith('wiki_content/') and f.endswith('.html')]
         wiki_pub = wiki_unpub = 0
+        to_read = []
 
         for page_path in wiki_files:
             page_name = page_path.replace('wiki_content/', '').replace('.html', '')
@@ -319,94 +578,49 @@ def read_imscc(file_path, file_bytes=None, syllabus_text=''):
             if is_media_page(page_name):
                 data['wiki_titles'].append(page_name)
             else:
-                try:
-                    raw   = z.read(page_path).decode('utf-8', errors='ignore')
-                    clean = strip_html(raw).strip()
-                    if clean:
-                        data['wiki_full'][page_name] = clean
-                        data['wiki_raw'][page_name] = raw
-                except Exception:
-                    data['wiki_full'][page_name] = '[could not read]'
+                to_read.append((page_name, page_path))
 
-        print(f"   Wiki pages published: {wiki_pub} | unpublished/unused: {wiki_unpub}")
+        pages = pmap(lambda t: _read_wiki_page(z, t[1]), to_read)
+        for (page_name, _), page in zip(to_read, pages):
+            if page is None:
+                data['wiki_full'][page_name] = '[could not read]'
+                continue
+            raw, clean = page
+            if clean:
+                data['wiki_full'][page_name] = clean
+                data['wiki_raw'][page_name] = raw
+
+        log(f"   Wiki pages published: {wiki_pub} | unpublished/unused: {wiki_unpub}")
 
         # Assignments
-        assign_html_files = [
-            f for f in files
-            if f.endswith('.html') and not f.startswith('wiki_content/')
-            and not f.startswith('web_resources/') and 'syllabus' not in f.lower() and '/' in f
-        ]
         assign_pub = assign_unpub = 0
 
-        for assign_path in assign_html_files:
-            try:
-                parts     = assign_path.split('/')
-                folder_id = parts[0]
-                file_name = parts[-1]
-                settings_path = f"{folder_id}/assignment_settings.xml"
-                published = True
-                due_date = 'Not set'
-                points = 'Not specified'
-                sub_type = 'Not specified'
-                clean_name = clean_assignment_name(folder_id, file_name)
-
-                if settings_path in files:
-                    xml = z.read(settings_path).decode('utf-8', errors='ignore')
-                    state_m  = re.search(r'<workflow_state>(.+?)</workflow_state>', xml, re.DOTALL)
-                    due_m    = re.search(r'<due_at>(.+?)</due_at>', xml, re.DOTALL)
-                    pts_m    = re.search(r'<points_possible>(.+?)</points_possible>', xml, re.DOTALL)
-                    sub_m    = re.search(r'<submission_types>(.+?)</submission_types>', xml, re.DOTALL)
-                    title_m  = re.search(r'<title>(.+?)</title>', xml, re.DOTALL)
-                    if state_m: published = is_published_state(state_m.group(1))
-                    if due_m:   due_date = format_due_date(due_m.group(1).strip())
-                    if pts_m:   points = pts_m.group(1).strip()
-                    if sub_m:   sub_type = strip_html(sub_m.group(1)).strip()
-                    if title_m: clean_name = strip_html(title_m.group(1)).strip()
-
-                if not published:
-                    assign_unpub += 1
-                    data['assignments_unpub'].append(clean_name)
-                    continue
-
-                raw_html     = z.read(assign_path).decode('utf-8', errors='ignore')
-                instructions = strip_html(raw_html).strip()
-                if instructions:
-                    assign_pub += 1
-                    data['assignments'][clean_name] = {
-                        'instructions': instructions, 'due_date': due_date,
-                        'points': points, 'sub_type': sub_type, 'folder_id': folder_id,
-                        'instructions_raw': raw_html,
-                    }
-            except Exception:
-                pass
+        for result in pmap(lambda p: _read_assignment(z, p, files_set), assign_html_files):
+            if result is None:
+                continue
+            status, clean_name, record = result
+            if status == 'unpublished':
+                assign_unpub += 1
+                data['assignments_unpub'].append(clean_name)
+            else:
+                assign_pub += 1
+                data['assignments'][clean_name] = record
 
-        print(f"   Assignments published: {assign_pub} | unpublished: {assign_unpub}")
+        log(f"   Assignments published: {assign_pub} | unpublished: {assign_unpub}")
 
         # Assessments
-        assess_files = [f for f in files if 'assessment_qti.xml' in f]
         assess_pub = assess_unpub = 0
-        for assess_path in assess_files[:15]:
-            try:
-                folder_id     = assess_path.split('/')[0]
-                settings_path = f"{folder_id}/assessment_meta.xml"
-                published     = True
-                if settings_path in files:
-                    xml     = z.read(settings_path).decode('utf-8', errors='ignore')
-                    state_m = re.search(r'<workflow_state>(.+?)</workflow_state>', xml, re.DOTALL)
-                    if state_m: published = is_published_state(state_m.group(1))
-                if not published:
-                    assess_unpub += 1
-                    continue
-                raw   = z.read(assess_path).decode('utf-8', errors='ignore')
-                clean = strip_html(raw).strip()
-                name  = assess_path.split('/')[-2]
-                if clean:
-                    assess_pub += 1
-                    data['assessments'][name] = clean[:2000]
-            except Exception:
-                pass
+        for result in pmap(lambda p: _read_assessment(z, p, files_set), assess_files[:15]):
+            if result is None:
+                continue
+            status, name, clean = result
+            if status == 'unpublished':
+                assess_unpub += 1
+            else:
+                assess_pub += 1
+                data['assessments'][name] = clean
 
-        print(f"   Assessments published: {assess_pub} | unpublished: {assess_unpub}")
+        log(f"   Assessments published: {assess_pub} | unpublished: {assess_unpub}")
 
         data['publish_stats'] = {
             'wiki_published': wiki_pub, 'wiki_unpublished': wiki_unpub,
@@ -414,6 +628,9 @@ def read_imscc(file_path, file_bytes=None, syllabus_text=''):
             'assess_published': assess_pub, 'assess_unpublished': assess_unpub,
         }
 
+    # Page title lists are only ever listed alphabetically; sort them once here.
+    data['wiki_titles'].sort()
+    data['wiki_unpublished'].sort()
     return data
 
 
@@ -427,9 +644,8 @@ def extract_course_identity(data):
     settings = data.get('course_settings', '')
     if not settings:
         return identity
-    for tag, key in [('title','title'),('course_code','code'),
-                     ('start_at','start_date'),('conclude_at','end_date')]:
-        m = re.search(rf'<{tag}>(.+?)</{tag}>', settings, re.DOTALL)
+    for pattern, key in _IDENTITY_TAGS:
+        m = pattern.search(settings)
         if m:
             val = strip_html(m.group(1)).strip()
             identity[key] = val[:10] if key in ('start_date','end_date') else val
@@ -445,40 +661,36 @@ def extract_modules(data):
     meta = data.get('module_meta', '')
     if not meta:
         return modules
-    for block in re.split(r'<module\s+identifier=[^>]+>', meta)[1:]:
-        title_m = re.search(r'<title>(.+?)</title>', block, re.DOTALL)
-        pos_m   = re.search(r'<position>(.+?)</position>', block, re.DOTALL)
-        state_m = re.search(r'<workflow_state>(.+?)</workflow_state>', block, re.DOTALL)
+    for block in _iter_blocks(_RE_MODULE_START, meta):
+        title_m = _RE_TITLE.search(block)
+        pos_m   = _RE_POSITION.search(block)
+        state_m = _RE_WORKFLOW.search(block)
         mod_title = strip_html(title_m.group(1)).strip() if title_m else 'Untitled Module'
         state     = state_m.group(1).strip() if state_m else 'active'
         if not is_published_state(state):
             continue
-        items_section = re.search(r'<items>(.*?)</items>', block, re.DOTALL)
+        items_section = _RE_ITEMS_SECTION.search(block)
         items = []
         current_week = None
+        week_nums = {}   # week header label -> week number, for ordering
         if items_section:
-            for item_block in re.split(r'<item\s+identifier=[^>]+>', items_section.group(1))[1:]:
-                t_m      = re.search(r'<title>(.+?)</title>', item_block, re.DOTALL)
-                ct_m     = re.search(r'<content_type>(.+?)</content_type>', item_block, re.DOTALL)
-                istate_m = re.search(r'<workflow_state>(.+?)</workflow_state>', item_block, re.DOTALL)
-                if not t_m: continue
-                item_title = strip_html(t_m.group(1)).strip()
-                item_type  = strip_html(ct_m.group(1)).strip() if ct_m else ''
-                item_state = istate_m.group(1).strip() if istate_m else 'active'
+            for item_m in _RE_MODULE_ITEM.finditer(items_section.group(1)):
+                fields = _first_fields(_RE_ITEM_FIELDS, item_m.group(1))
+                if 'title' not in fields: continue
+                item_title = strip_html(fields['title']).strip()
+                item_type  = strip_html(fields.get('content_type', '')).strip()
+                item_state = fields.get('workflow_state', 'active').strip()
                 if not is_published_state(item_state): continue
-                week_match = re.match(r'week\s+(\d+)\s*(?:[|:—\-]\s*(.+))?', item_title, re.IGNORECASE)
+                week_match = _RE_WEEK.match(item_title)
                 if week_match:
                     wn = week_match.group(1)
                     wl = week_match.group(2).strip() if week_match.group(2) else ''
                     current_week = f"Week {wn}" + (f" — {wl}" if wl else '')
-                    items.append({'title': item_title, 'type': item_type,
-                                  'is_week_header': True, 'week': current_week, 'published': True})
-                else:
-                    items.append({'title': item_title, 'type': item_type,
-                                  'is_week_header': False, 'week': current_week, 'published': True})
-        weeks_in_module = sorted(
-            set(i['week'] for i in items if i.get('week') and i.get('is_week_header')),
-            key=lambda w: int(re.search(r'\d+', w).group()) if re.search(r'\d+', w) else 0)
+                    week_nums[current_week] = int(wn)
+                items.append({'title': item_title, 'type': item_type,
+                              'is_week_header': week_match is not None,
+                              'week': current_week, 'published': True})
+        weeks_in_module = sorted(week_nums, key=week_nums.get)
         modules.append({
             'title': mod_title, 'position': pos_m.group(1).strip() if pos_m else '?',
             'state': state, 'items': items, 'weeks_in_module': weeks_in_module,
@@ -490,42 +702,51 @@ def extract_grading_structure(data):
     groups = []
     xml = data.get('assignment_groups', '')
     if not xml: return groups
-    for block in re.split(r'<assignmentGroup\s+identifier=[^>]+>', xml)[1:]:
-        t_m = re.search(r'<title>(.+?)</title>', block, re.DOTALL)
-        w_m = re.search(r'<group_weight>(.+?)</group_weight>', block, re.DOTALL)
-        p_m = re.search(r'<position>(.+?)</position>', block, re.DOTALL)
-        name = strip_html(t_m.group(1)).strip() if t_m else 'Unnamed'
-        pos  = p_m.group(1).strip() if p_m else '?'
-        try: weight = f"{float(w_m.group(1).strip()):.1f}" if w_m else '0.0'
-        except ValueError: weight = w_m.group(1).strip() if w_m else '0.0'
-        groups.append({'name': name, 'weight': weight, 'position': pos})
+    for block in _iter_blocks(_RE_GROUP_START, xml):
+        fields = _first_fields(_RE_GROUP_FIELDS, block)
+        name = strip_html(fields['title']).strip() if 'title' in fields else 'Unnamed'
+        pos  = fields.get('position', '?').strip()
+        raw_weight = fields.get('group_weight', '0.0').strip()
+        # 'weight' is display text; 'weight_f' is the same value as a float,
+        # or None when the export holds something non-numeric.
+        try:
+            weight_f = round(float(raw_weight), 1)
+            weight = f"{weight_f:.1f}"
+        except ValueError:
+            weight, weight_f = raw_weight, None
+        groups.append({'name': name, 'weight': weight, 'weight_f': weight_f, 'position': pos})
     groups.sort(key=lambda g: int(g['position']) if g['position'].isdigit() else 99)
     return groups
 
 
-def extract_rubrics(data):
-    """Deep rubric extraction using XML parser with namespace stripping."""
+def strip_xml_namespaces(xml):
+    """Drop namespace declarations, tag prefixes and prefixed attributes so plain tag names match."""
+    xml = _RE_XMLNS_DECL.sub('', xml)
+    xml = _RE_TAG_PREFIX.sub(r'<\1', xml)
+    return _RE_PREFIXED_ATTR.sub('', xml)
+
+
+def extract_rubrics(data, log=print):
+    """Deep rubric extraction using XML parser with namespace stripping.
+    Progress lines go to `log` (print by default)."""
     rubrics = []
     xml = data.get('rubrics', '')
     if not xml:
-        print("   Rubrics: rubrics.xml not found or empty")
+        log("   Rubrics: rubrics.xml not found or empty")
         return rubrics
 
-    print(f"   Rubrics: raw XML is {len(xml):,} chars")
+    log(f"   Rubrics: raw XML is {len(xml):,} chars")
 
-    # Strip namespaces
-    clean_xml = re.sub(r'\sxmlns(?::\w+)?\s*=\s*["\'][^"\']*["\']', '', xml)
-    clean_xml = re.sub(r'<(/?)[\w]+:', r'<\1', clean_xml)
-    clean_xml = re.sub(r'\s\w+:\w+\s*=\s*["\'][^"\']*["\']', '', clean_xml)
+    clean_xml = strip_xml_namespaces(xml)
 
     # Try ET parsing
     try:
         root = ET.fromstring(clean_xml)
     except ET.ParseError:
-        print("   Rubrics: XML parse error, falling back to regex")
-        return _extract_rubrics_regex(clean_xml)
+        log("   Rubrics: XML parse error, falling back to regex")
+        return _extract_rubrics_regex(clean_xml, log)
 
-    print(f"   Rubrics: root tag = '{root.tag}'")
+    log(f"   Rubrics: root tag = '{root.tag}'")
 
     if root.tag == 'rubrics':
         rubric_elements = root.findall('rubric')
@@ -539,10 +760,10 @@ def extract_rubrics(data):
                 rubric_elements.append(el)
 
     if not rubric_elements:
-        print("   Rubrics: ET found nothing, falling back to regex")
-        return _extract_rubrics_regex(clean_xml)
+        log("   Rubrics: ET found nothing, falling back to regex")
+        return _extract_rubrics_regex(clean_xml, log)
 
-    print(f"   Rubrics: found {len(rubric_elements)} <rubric> element(s)")
+    log(f"   Rubrics: found {len(rubric_elements)} <rubric> element(s)")
 
     for rubric_el in rubric_elements:
         title = (rubric_el.findtext('title') or 'Untitled Rubric').strip()
@@ -569,31 +790,31 @@ def extract_rubrics(data):
 
     total_criteria = sum(len(r['criteria']) for r in rubrics)
     total_ratings = sum(len(c['ratings']) for r in rubrics for c in r['criteria'])
-    print(f"   Rubrics: extracted {len(rubrics)} rubric(s), {total_criteria} criteria, {total_ratings} rating levels")
+    log(f"   Rubrics: extracted {len(rubrics)} rubric(s), {total_criteria} criteria, {total_ratings} rating levels")
     return rubrics
 
 
-def _extract_rubrics_regex(xml):
+def _extract_rubrics_regex(xml, log=print):
     """Regex fallback for rubric extraction."""
     rubrics = []
-    for block in re.findall(r'<rubric>(.*?)</rubric>', xml, re.DOTALL):
-        t_m = re.search(r'<title>(.*?)</title>', block, re.DOTALL)
+    for block in _RE_RB_RUBRIC.findall(xml):
+        t_m = _RE_RB_TITLE.search(block)
         title = strip_html(t_m.group(1)).strip() if t_m else 'Untitled'
-        pp_m = re.search(r'<points_possible>(.*?)</points_possible>', block, re.DOTALL)
+        pp_m = _RE_RB_POINTS_PP.search(block)
         criteria = []
-        criteria_m = re.search(r'<criteria>(.*?)</criteria>', block, re.DOTALL)
+        criteria_m = _RE_RB_CRITERIA.search(block)
         if criteria_m:
-            for cb in re.findall(r'<criterion>(.*?)</criterion>', criteria_m.group(1), re.DOTALL):
-                desc_m = re.search(r'<description>(.*?)</description>', cb, re.DOTALL)
-                long_m = re.search(r'<long_description>(.*?)</long_description>', cb, re.DOTALL)
-                pts_m  = re.search(r'<points>(.*?)</points>', cb, re.DOTALL)
+            for cb in _RE_RB_CRITERION.findall(criteria_m.group(1)):
+                desc_m = _RE_RB_DESC.search(cb)
+                long_m = _RE_RB_LONG_DESC.search(cb)
+                pts_m  = _RE_RB_POINTS.search(cb)
                 ratings = []
-                ratings_m = re.search(r'<ratings>(.*?)</ratings>', cb, re.DOTALL)
+                ratings_m = _RE_RB_RATINGS.search(cb)
                 if ratings_m:
-                    for rb in re.findall(r'<rating>(.*?)</rating>', ratings_m.group(1), re.DOTALL):
-                        r_d = re.search(r'<description>(.*?)</description>', rb, re.DOTALL)
-                        r_l = re.search(r'<long_description>(.*?)</long_description>', rb, re.DOTALL)
-                        r_p = re.search(r'<points>(.*?)</points>', rb, re.DOTALL)
+                    for rb in _RE_RB_RATING.findall(ratings_m.group(1)):
+                        r_d = _RE_RB_DESC.search(rb)
+                        r_l = _RE_RB_LONG_DESC.search(rb)
+                        r_p = _RE_RB_POINTS.search(rb)
                         r_name = strip_html(r_d.group(1)).strip() if r_d else ''
                         if r_name:
                             ratings.append({'name': r_name,
@@ -605,7 +826,7 @@ def _extract_rubrics_regex(xml):
                     'points': pts_m.group(1).strip() if pts_m else '?',
                     'ratings': ratings})
         rubrics.append({'title': title, 'points': pp_m.group(1).strip() if pp_m else '', 'criteria': criteria})
-    print(f"   Rubrics (regex): extracted {len(rubrics)} rubric(s)")
+    log(f"   Rubrics (regex): extracted {len(rubrics)} rubric(s)")
     return rubrics
 
 
@@ -613,181 +834,192 @@ def _extract_rubrics_regex(xml):
 #  DOCUMENT BUILDER
 # ─────────────────────────────────────────────────────────────
 
-def build_course_dna(data, identity, modules, grading_groups, rubrics):
+def build_course_dna(data, identity, modules, grading_groups, rubrics, out=None):
+    """
+    Build the Course DNA Document. With `out` (a writable text stream) the
+    document is written as it is built and nothing is returned. Without it
+    the document string is returned.
+    """
+    stream = out if out is not None else io.StringIO()
+    write = stream.write
     today = datetime.now().strftime('%Y-%m-%d')
     stats = data.get('publish_stats', {})
+    wp, wu = stats.get('wiki_published', 0), stats.get('wiki_unpublished', 0)
+    ap, au = stats.get('assign_published', 0), stats.get('assign_unpublished', 0)
+    qp = stats.get('assess_published', 0)
     syl_text = data.get('syllabus_text', '')
 
-    L = [
-        '# CeCe Course DNA Document',
-        f'> Extracted {today} from `{data["file_name"]}`',
-        '> This document contains the complete published content of the Canvas course.',
-        '> It is organized for MeMe to conduct a QM 7th Edition needs analysis.',
-        '> CeCe does not evaluate — she extracts. All analysis is performed by MeMe.',
-        '', '---',
-    ]
+    def w(*lines):
+        # Lines go straight to the stream; no intermediate list is built up.
+        write('\n'.join(lines))
+        write('\n')
+
+    # HTML metadata is parsed once per page/assignment and shared by
+    # Sections 6, 11 and 12 instead of being re-extracted for each.
+    page_meta = {name: extract_html_metadata(raw)
+                 for name, raw in data.get('wiki_raw', {}).items()}
+    assign_meta = {name: extract_html_metadata(det['instructions_raw'])
+                   for name, det in data['assignments'].items()
+                   if det.get('instructions_raw')}
+
+    w('# CeCe Course DNA Document',
+      f'> Extracted {today} from `{data["file_name"]}`',
+      '> This document contains the complete published content of the Canvas course.',
+      '> It is organized for MeMe to conduct a QM 7th Edition needs analysis.',
+      '> CeCe does not evaluate — she extracts. All analysis is performed by MeMe.',
+      '', '---')
 
     # Section 1: Course Identity
-    L += ['', '## SECTION 1: COURSE IDENTITY', '',
-        '| Field | Value |', '|-------|-------|',
-        f'| Course Title | {identity["title"]} |',
-        f'| Course Code  | {identity["code"]} |',
-        f'| Delivery Mode | {identity["modality"]} |',
-        f'| Start Date | {identity["start_date"]} |',
-        f'| End Date   | {identity["end_date"]} |',
-        f'| Published Modules | {len(modules)} |',
-        f'| Published Content Pages | {stats.get("wiki_published",0)} |',
-        f'| Published Assignments | {stats.get("assign_published",0)} |',
-        f'| Published Quizzes | {stats.get("assess_published",0)} |',
-        f'| LTI / External Tools | {len(data["lti_tools"])} |',
-        f'| Unpublished Pages | {stats.get("wiki_unpublished",0)} |',
-        f'| Unpublished Assignments | {stats.get("assign_unpublished",0)} |',
-        f'| Syllabus Provided | {"Yes (" + str(len(syl_text)) + " chars)" if syl_text else "No"} |',
-        f'| Generated | {today} |', '', '---']
+    w('', '## SECTION 1: COURSE IDENTITY', '',
+      '| Field | Value |', '|-------|-------|',
+      f'| Course Title | {identity["title"]} |',
+      f'| Course Code  | {identity["code"]} |',
+      f'| Delivery Mode | {identity["modality"]} |',
+      f'| Start Date | {identity["start_date"]} |',
+      f'| End Date   | {identity["end_date"]} |',
+      f'| Published Modules | {len(modules)} |',
+      f'| Published Content Pages | {wp} |',
+      f'| Published Assignments | {ap} |',
+      f'| Published Quizzes | {qp} |',
+      f'| LTI / External Tools | {len(data["lti_tools"])} |',
+      f'| Unpublished Pages | {wu} |',
+      f'| Unpublished Assignments | {au} |',
+      f'| Syllabus Provided | {"Yes (" + str(len(syl_text)) + " chars)" if syl_text else "No"} |',
+      f'| Generated | {today} |', '', '---')
 
     # Section 2: Publish Status
-    L += ['', '## SECTION 2: PUBLISH STATUS',
-        '> Items below were detected but are NOT included in this document.', '']
+    w('', '## SECTION 2: PUBLISH STATUS',
+      '> Items below were detected but are NOT included in this document.', '')
     if data['wiki_unpublished']:
-        L.append('**Unpublished Pages:**')
-        for p in sorted(data['wiki_unpublished']): L.append(f'- {p}')
-        L.append('')
+        w('**Unpublished Pages:**', *(f'- {p}' for p in data['wiki_unpublished']), '')
     if data['assignments_unpub']:
-        L.append('**Unpublished Assignments:**')
-        for a in data['assignments_unpub']: L.append(f'- {a}')
-        L.append('')
+        w('**Unpublished Assignments:**', *(f'- {a}' for a in data['assignments_unpub']), '')
     if not data['wiki_unpublished'] and not data['assignments_unpub']:
-        L.append('*All detected content is published.*')
-    L += ['', '---']
+        w('*All detected content is published.*')
+    w('', '---')
 
     # Section 3: Syllabus
-    L += ['', '## SECTION 3: SYLLABUS', '']
+    w('', '## SECTION 3: SYLLABUS', '')
     if syl_text:
-        L += [syl_text, '']
+        w(syl_text, '')
     else:
-        L += ['*Syllabus was not provided. MeMe should request it from the instructor.*', '']
-    L += ['---']
+        w('*Syllabus was not provided. MeMe should request it from the instructor.*', '')
+    w('---')
 
     # Section 4: Module Structure
-    L += ['', '## SECTION 4: MODULE & WEEK STRUCTURE', '']
+    w('', '## SECTION 4: MODULE & WEEK STRUCTURE', '')
     if not modules:
-        L.append('*No published modules found.*')
+        w('*No published modules found.*')
     else:
+        # Local bindings for the per-item rows, which run once per module item.
+        label, cell = item_type_label, _safe_cell
         for i, mod in enumerate(modules, 1):
             weeks = mod.get('weeks_in_module', [])
             week_note = f' ({", ".join(weeks)})' if weeks else ''
-            L += [f'### Module {i}: {mod["title"]}{week_note}', '']
+            w(f'### Module {i}: {mod["title"]}{week_note}', '')
             if mod['items']:
-                L += ['| # | Item | Type | Week |', '|---|------|------|------|']
-                for j, item in enumerate(mod['items'], 1):
-                    itype = item.get('type', '').replace('WikiPage', 'Page').replace('DiscussionTopic', 'Discussion').replace('Quizzes::Quiz', 'Quiz').replace('ContextModuleSubHeader', 'Header').replace('ExternalUrl', 'External Link').replace('ContextExternalTool', 'LTI Tool')
-                    L.append(f'| {j} | {item["title"].replace("|","/")} | {itype} | {item.get("week","") or ""} |')
-                L.append('')
-    L += ['---']
+                # Each table is joined in one C-level call rather than written row by row.
+                w('| # | Item | Type | Week |', '|---|------|------|------|',
+                  *(f'| {j} | {cell(item["title"])} | '
+                    f'{label(item.get("type", ""))} | {item.get("week") or ""} |'
+                    for j, item in enumerate(mod['items'], 1)), '')
+    w('---')
 
     # Section 5: Grading Structure
-    L += ['', '## SECTION 5: GRADING STRUCTURE', '']
+    w('', '## SECTION 5: GRADING STRUCTURE', '')
     if not grading_groups:
-        L.append('*No grading structure found.*')
+        w('*No grading structure found.*')
     else:
-        L += ['| Group Name | Weight (%) |', '|------------|-----------|']
-        total_weight = 0.0
-        for g in grading_groups:
-            L.append(f'| {g["name"]} | {g["weight"]}% |')
-            try: total_weight += float(g['weight'])
-            except ValueError: pass
-        L += [f'| **Total** | **{total_weight:.1f}%** |', '']
+        w('| Group Name | Weight (%) |', '|------------|-----------|')
+        w(*(f'| {_safe_cell(g["name"])} | {g["weight"]}% |' for g in grading_groups))
+        total_weight = sum(g['weight_f'] for g in grading_groups if g['weight_f'] is not None)
+        w(f'| **Total** | **{total_weight:.1f}%** |', '')
         if abs(total_weight - 100) > 1:
-            L.append(f'*Note: Weights sum to {total_weight:.1f}%, not 100%.*')
-    L += ['', '---']
+            w(f'*Note: Weights sum to {total_weight:.1f}%, not 100%.*')
+    w('', '---')
 
     # Section 6: Assignment Inventory
-    L += ['', '## SECTION 6: ASSIGNMENT INVENTORY', '']
+    w('', '## SECTION 6: ASSIGNMENT INVENTORY', '')
     if not data['assignments']:
-        L.append('*No published assignments found.*')
+        w('*No published assignments found.*')
     else:
         for name, det in data['assignments'].items():
-            L += [f'### {name}', '',
-                f'**Points:** {det["points"]} | **Due:** {det["due_date"]} | **Submission:** {det["sub_type"]}', '']
+            w(f'### {name}', '',
+              f'**Points:** {det["points"]} | **Due:** {det["due_date"]} | **Submission:** {det["sub_type"]}', '')
             # Add metadata block if raw HTML is available
-            raw_html = det.get('instructions_raw', '')
-            if raw_html:
-                meta = extract_html_metadata(raw_html)
+            meta = assign_meta.get(name)
+            if meta:
                 meta_block = format_metadata_block(meta)
                 if meta_block:
-                    L += [meta_block]
-            L += ['**Instructions:**', det['instructions'], '', '---', '']
-    L += ['---']
+                    w(meta_block)
+            w('**Instructions:**', det['instructions'], '', '---', '')
+    w('---')
 
     # Section 7: Assessments
-    L += ['', '## SECTION 7: ASSESSMENTS / QUIZZES', '']
+    w('', '## SECTION 7: ASSESSMENTS / QUIZZES', '')
     if not data['assessments']:
-        L.append('*No published assessments found.*')
+        w('*No published assessments found.*')
     else:
         for name, content in data['assessments'].items():
-            L += [f'### {name}', '', content, '', '---', '']
-    L += ['---']
+            w(f'### {name}', '', content, '', '---', '')
+    w('---')
 
     # Section 8: Rubrics
-    L += ['', '## SECTION 8: RUBRICS', '']
+    w('', '## SECTION 8: RUBRICS', '')
     if not rubrics:
-        L.append('*No rubrics found. This is a significant gap for QM Standard 3.3.*')
+        w('*No rubrics found. This is a significant gap for QM Standard 3.3.*')
     else:
         for rub in rubrics:
             pts_note = f' ({rub["points"]} pts total)' if rub.get('points') else ''
-            L += [f'### {rub["title"]}{pts_note}', '']
+            w(f'### {rub["title"]}{pts_note}', '')
             for crit in rub['criteria']:
                 crit_desc = f' — {crit["description"]}' if crit.get('description') else ''
-                L.append(f'**Criterion: {crit["name"]}** ({crit["points"]} pts){crit_desc}')
-                L.append('')
+                w(f'**Criterion: {crit["name"]}** ({crit["points"]} pts){crit_desc}', '')
                 if crit['ratings']:
-                    L += ['| Rating | Points | Description |', '|--------|--------|-------------|']
-                    for rating in crit['ratings']:
-                        desc = rating['description'].replace('|', '/').replace('\n', ' ')
-                        L.append(f'| {rating["name"]} | {rating["points"]} | {desc} |')
-                    L.append('')
+                    w('| Rating | Points | Description |', '|--------|--------|-------------|',
+                      *(f'| {_safe_cell(rating["name"])} | {rating["points"]} | '
+                        f'{_safe_cell(rating["description"])} |'
+                        for rating in crit['ratings']), '')
                 else:
-                    L.append('*No rating levels defined.*')
-                    L.append('')
-            L += ['---', '']
-    L += ['---']
+                    w('*No rating levels defined.*', '')
+            w('---', '')
+    w('---')
 
     # Section 9: Materials
-    L += ['', '## SECTION 9: INSTRUCTIONAL MATERIALS', '']
+    w('', '## SECTION 9: INSTRUCTIONAL MATERIALS', '')
     if data['wiki_titles']:
-        for t in sorted(data['wiki_titles']): L.append(f'- {t}')
+        w(*(f'- {t}' for t in data['wiki_titles']))
     else:
-        L.append('*No media/resource pages identified.*')
-    L += ['', '---']
+        w('*No media/resource pages identified.*')
+    w('', '---')
 
     # Section 10: LTI Tools
-    L += ['', '## SECTION 10: LTI TOOLS & EXTERNAL INTEGRATIONS', '']
+    w('', '## SECTION 10: LTI TOOLS & EXTERNAL INTEGRATIONS', '')
     if data['lti_tools']:
-        L += ['| Tool Name | Launch URL |', '|-----------|-----------|']
-        for tool in data['lti_tools']:
-            L.append(f'| {tool["name"]} | {tool.get("url", "N/A")} |')
+        w('| Tool Name | Launch URL |', '|-----------|-----------|',
+          *(f'| {_safe_cell(tool["name"])} | {tool.get("url", "N/A")} |'
+            for tool in data['lti_tools']))
     else:
-        L.append('*No LTI tools detected.*')
-    L += ['', '---']
+        w('*No LTI tools detected.*')
+    w('', '---')
 
     # Section 11: Full Page Content
-    L += ['', '## SECTION 11: COURSE PAGE CONTENT',
-        '> Each page includes an HTML metadata block (headings, links, images, accessibility flags)',
-        '> followed by the plain text content. MeMe uses metadata for QM 7.x and 8.x evaluation.', '']
+    w('', '## SECTION 11: COURSE PAGE CONTENT',
+      '> Each page includes an HTML metadata block (headings, links, images, accessibility flags)',
+      '> followed by the plain text content. MeMe uses metadata for QM 7.x and 8.x evaluation.', '')
     for page_name, content in data['wiki_full'].items():
-        L += [f'### {page_name}', '']
+        w(f'### {page_name}', '')
         # Add metadata block if raw HTML is available
-        raw_html = data.get('wiki_raw', {}).get(page_name, '')
-        if raw_html:
-            meta = extract_html_metadata(raw_html)
+        meta = page_meta.get(page_name)
+        if meta:
             meta_block = format_metadata_block(meta)
             if meta_block:
-                L += [meta_block]
-        L += ['**Page Content:**', '', content, '', '---', '']
-    L += ['---']
+                w(meta_block)
+        w('**Page Content:**', '', content, '', '---', '')
+    w('---')
 
     # Section 12: Notes for MeMe
-    L += ['', '## SECTION 12: NOTES FOR MEME', '']
+    w('', '## SECTION 12: NOTES FOR MEME', '')
     notes = []
     if not syl_text:
         notes.append('Syllabus not provided. Request it before evaluating GS 1 and GS 2.')
@@ -799,34 +1031,30 @@ def build_course_dna(data, identity, modules, grading_groups, rubrics):
         notes.append(f'{len(rubrics)} rubric(s), {tc} criteria, {tr} with detailed ratings.')
     if not modules:
         notes.append('No published modules found.')
-    up = stats.get('assign_unpublished', 0) + stats.get('wiki_unpublished', 0)
+    up = au + wu
     if up > 0:
         notes.append(f'{up} item(s) were unpublished and excluded.')
 
     # Aggregate accessibility flags from all pages
-    all_a11y_flags = []
     total_images = 0
     missing_alt = 0
     total_links = 0
-    bad_link_text = 0
-    heading_skips = 0
 
-    for page_name in data.get('wiki_raw', {}):
-        meta = extract_html_metadata(data['wiki_raw'][page_name])
+    # Notes are tallied by their kind (the text before the colon) in one pass.
+    note_kinds = Counter()
+    for meta in page_meta.values():
         total_images += len(meta['images'])
         missing_alt += sum(1 for alt, _ in meta['images'] if 'MISSING' in alt)
         total_links += len(meta['links'])
-        bad_link_text += sum(1 for n in meta['accessibility_notes'] if 'Non-descriptive link' in n)
-        heading_skips += sum(1 for n in meta['accessibility_notes'] if 'Heading level skipped' in n)
+        note_kinds.update(n.split(':', 1)[0] for n in meta['accessibility_notes'])
+    bad_link_text = note_kinds['Non-descriptive link text']
+    heading_skips = note_kinds['Heading level skipped']
 
-    for det in data['assignments'].values():
-        raw = det.get('instructions_raw', '')
-        if raw:
-            meta = extract_html_metadata(raw)
-            total_images += len(meta['images'])
-            missing_alt += sum(1 for alt, _ in meta['images'] if 'MISSING' in alt)
+    for meta in assign_meta.values():
+        total_images += len(meta['images'])
+        missing_alt += sum(1 for alt, _ in meta['images'] if 'MISSING' in alt)
 
-    notes.append(f'HTML metadata extracted for {len(data.get("wiki_raw", {}))} pages and {len(data["assignments"])} assignments.')
+    notes.append(f'HTML metadata extracted for {len(page_meta)} pages and {len(data["assignments"])} assignments.')
     if total_images > 0:
         notes.append(f'Images: {total_images} total, {missing_alt} missing alt text (QM 8.4).')
     if bad_link_text > 0:
@@ -834,16 +1062,16 @@ def build_course_dna(data, identity, modules, grading_groups, rubrics):
     if heading_skips > 0:
         notes.append(f'Heading hierarchy skipped {heading_skips} time(s) (QM 8.2).')
 
-    for note in notes:
-        L.append(f'- {note}')
-    L += ['', '---']
+    w(*(f'- {note}' for note in notes))
+    w('', '---')
 
     # Appendix: QM Reference
-    L += ['', '## APPENDIX: QM 7TH EDITION RUBRIC REFERENCE', '']
-    L += _qm_reference_appendix()
-    L += ['', '---', f'*CeCe Course DNA Document v6.1 — Generated {today}*']
-
-    return '\n'.join(L)
+    w('', '## APPENDIX: QM 7TH EDITION RUBRIC REFERENCE', '')
+    w(_QM_APPENDIX)
+    w('', '---')
+    write(f'*CeCe Course DNA Document v6.1 — Generated {today}*')
+    if out is None:
+        return stream.getvalue()
 
 
 def _qm_reference_appendix():
@@ -919,42 +1147,141 @@ def _qm_reference_appendix():
     return L
 
 
+# The appendix never changes, so it is joined once at import and written as a
+# single block by build_course_dna.
+_QM_APPENDIX = '\n'.join(_qm_reference_appendix())
+
+
 # ─────────────────────────────────────────────────────────────
 #  MAIN
 # ─────────────────────────────────────────────────────────────
 
-def main():
-    print('\n' + '='*60)
-    print('  CeCe Course DNA Extraction Agent v6.1')
-    print('='*60)
-    if len(sys.argv) < 2:
-        print('\nUsage:  python analyze.py your-course.imscc')
-        sys.exit(1)
-    imscc_path = sys.argv[1]
-    if not os.path.exists(imscc_path):
-        print(f'\n❌ File not found: {imscc_path}')
-        sys.exit(1)
-    syl_text = ''
-    if '--syllabus' in sys.argv:
-        idx = sys.argv.index('--syllabus') + 1
-        if idx < len(sys.argv) and os.path.exists(sys.argv[idx]):
-            with open(sys.argv[idx], 'r', encoding='utf-8', errors='ignore') as f:
-                syl_text = f.read()
+class _CharCounter:
+    """Write-through text stream wrapper that counts the characters written."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.chars = 0
 
-    data     = read_imscc(imscc_path, syllabus_text=syl_text)
+    def write(self, s):
+        self.chars += len(s)
+        return self.stream.write(s)
+
+
+def run_one(imscc_path, syl_text='', workers=None):
+    """Run the full extraction pipeline for one course and write `<base>_dna.md`."""
+    data     = read_imscc(imscc_path, syllabus_text=syl_text, workers=workers)
     identity = extract_course_identity(data)
     modules  = extract_modules(data)
     grading  = extract_grading_structure(data)
     rubrics  = extract_rubrics(data)
-    document = build_course_dna(data, identity, modules, grading, rubrics)
 
     base = os.path.splitext(os.path.basename(imscc_path))[0]
     out_path = f'{base}_dna.md'
-    with open(out_path, 'w', encoding='utf-8') as f:
-        f.write(document)
+    # Stream into a temp file and move it into place only once the document is
+    # complete, so a failed build never leaves (or overwrites with) a fragment.
+    tmp_path = out_path + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            out = _CharCounter(f)
+            build_course_dna(data, identity, modules, grading, rubrics, out=out)
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
     print(f'\n✅ Course DNA Document saved to: {out_path}')
-    print(f'   Length: {len(document):,} characters')
+    print(f'   Length: {out.chars:,} characters')
+    return out_path
+
 
+def _run_one_buffered(imscc_path, syl_text=''):
+    """--jobs worker: run one course and hand back (log, ok) so its log prints as one block."""
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        try:
+            # Courses already run one per process; a thread pool per
+            # process would oversubscribe the CPUs.
+            run_one(imscc_path, syl_text, workers=1)
+        except Exception as e:
+            print(f'\n❌ {imscc_path}: {e}')
+            return buf.getvalue(), False
+    return buf.getvalue(), True
+
+
+def main():
+    print('\n' + '='*60)
+    print('  CeCe Course DNA Extraction Agent v6.1')
+    print('='*60)
+    args = sys.argv[1:]
+    paths, syl_path, jobs = [], None, 1
+    i = 0
+    while i < len(args):
+        if args[i] == '--syllabus':
+            syl_path = args[i + 1] if i + 1 < len(args) else None
+            i += 2
+            continue
+        if args[i] == '--jobs':
+            try:
+                jobs = max(1, int(args[i + 1]))
+            except (IndexError, ValueError):
+                print('\n❌ --jobs expects a number of worker processes')
+                sys.exit(1)
+            i += 2
+            continue
+        # Expand wildcards ourselves so batch runs also work on shells that don't.
+        paths += sorted(glob.glob(args[i])) or [args[i]]
+        i += 1
+
+    if not paths:
+        print('\nUsage:  python analyze.py your-course.imscc [more.imscc ...] '
+              '[--syllabus syllabus.txt] [--jobs N]')
+        sys.exit(1)
+    missing = [p for p in paths if not os.path.exists(p)]
+    if missing:
+        for p in missing:
+            print(f'\n❌ File not found: {p}')
+        sys.exit(1)
+    syl_text = ''
+    if syl_path and os.path.exists(syl_path):
+        with open(syl_path, 'r', encoding='utf-8', errors='ignore') as f:
+            syl_text = f.read()
+
+    # Outputs are named after the input's base name in the working directory, so
+    # two inputs with the same name would silently overwrite one another.
+    dupes = sorted(b for b, n in Counter(
+        os.path.splitext(os.path.basename(p))[0] for p in paths).items() if n > 1)
+    if dupes:
+        print(f'\n❌ Inputs share an output name: {", ".join(f"{b}_dna.md" for b in dupes)}')
+        sys.exit(1)
+
+    # A failing course is reported and the rest of the batch still runs, in
+    # both the sequential and the --jobs path; the exit status reflects failures.
+    failed = 0
+    if jobs == 1 or len(paths) == 1:
+        for p in paths:
+            try:
+                run_one(p, syl_text)
+            except Exception as e:
+                failed += 1
+                print(f'\n❌ {p}: {e}')
+    else:
+        # Each course is independent and CPU-bound (zip inflate, regex, string
+        # building), so courses are spread across worker processes. Workers buffer
+        # their own log so courses finishing together don't interleave lines.
+        with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as ex:
+            futures = {ex.submit(_run_one_buffered, p, syl_text): p for p in paths}
+            for fut in as_completed(futures):
+                try:
+                    log, ok = fut.result()
+                except Exception as e:
+                    log, ok = f'\n❌ {futures[fut]}: {e}\n', False
+                sys.stdout.write(log)
+                failed += not ok
+    if len(paths) > 1:
+        print(f'\n📚 Processed {len(paths) - failed}/{len(paths)} course(s)')
+    if failed:
+        sys.exit(1)
 
 if __name__ == '__main__':
     main()
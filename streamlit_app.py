@@ -4,10 +4,11 @@ Vice/Spring palette · Lexend typography · DNA + graduation cap branding
 """
 
 import streamlit as st
+import hashlib
 import io
 import os
-import sys
 import traceback
+from collections import deque
 
 st.set_page_config(page_title="CeCe — Course DNA", page_icon="🧬", layout="centered")
 
@@ -15,14 +16,46 @@ try:
     from analyze import (
         read_imscc, extract_course_identity, extract_modules,
         extract_grading_structure, extract_rubrics, build_course_dna,
+        strip_xml_namespaces,
     )
 except ImportError as e:
     st.error(f"Could not load analyze.py: {e}")
     st.stop()
 
 
+# ── Pipeline ────────────────────────────────────────────────────
+MAX_LOG_LINES = 2_000   # keep only the tail of a very chatty extraction log
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60, max_entries=2)
+def run_pipeline(file_key, file_name, _upload, syllabus_text):
+    """Run the full extraction for one upload. Cached on `file_key` and the syllabus text,
+    so re-extracting an unchanged course (or switching back to one) is instant. `_upload`
+    (the uploaded file object, read in place) is left out of the cache key."""
+    # Progress lines go to this session's own bounded buffer. Swapping sys.stdout
+    # would be process-wide, and sessions run concurrently on separate threads.
+    log_lines = deque(maxlen=MAX_LOG_LINES)
+    _upload.seek(0)
+    data = read_imscc(file_name, file_bytes=_upload, syllabus_text=syllabus_text,
+                      log=log_lines.append)
+    identity       = extract_course_identity(data)
+    modules        = extract_modules(data)
+    grading_groups = extract_grading_structure(data)
+    rubrics        = extract_rubrics(data, log=log_lines.append)
+    document       = build_course_dna(data, identity, modules, grading_groups, rubrics)
+    # The cache is process-wide and every hit is unpickled, so keep only what the
+    # results view reads; the page/assignment HTML in `data` stays out of it.
+    return {
+        "document_bytes": document.encode("utf-8"), "preview": document[:8000],
+        "identity": identity, "modules": modules, "rubrics": rubrics,
+        "stats": data.get("publish_stats", {}), "lti_tools": data.get("lti_tools", []),
+        "syllabus_text": data.get("syllabus_text", ""), "rubrics_xml": data.get("rubrics", ""),
+        "log": "\n".join(log_lines), "filename": file_name,
+    }
+
+
 # ── Styles ──────────────────────────────────────────────────────
-st.markdown("""
+# Re-emitted on every run: Streamlit drops elements a rerun doesn't emit again.
+_CSS = """
 <style>
     @import url('https://fonts.googleapis.com/css2?family=Lexend:wght@300;400;500;600;700&display=swap');
 
@@ -88,7 +121,10 @@ st.markdown("""
     .step4 { border-top: 3px solid #00b894; }
     .step4 .num { color: #00b894; }
 
+    .stat-row { display: flex; flex-wrap: wrap; gap: 1rem; }
     .stat-card {
+        flex: 1;
+        min-width: 90px;
         background: #f8f9fa;
         border-radius: 8px;
         padding: 10px;
@@ -133,7 +169,8 @@ st.markdown("""
     footer { visibility: hidden; }
     #MainMenu { visibility: hidden; }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(_CSS, unsafe_allow_html=True)
 
 
 # ── Header with SVG logo ────────────────────────────────────────
@@ -178,6 +215,15 @@ st.markdown("""
 
 
 # ── Step 1: Upload ──────────────────────────────────────────────
+# The real upload cap is server.maxUploadSize in .streamlit/config.toml, which
+# Streamlit enforces before the transfer, so the .imscc check below is only a
+# safety net for deployments that run without that config; keep
+# MAX_IMSCC_BYTES equal to it. The syllabus limit is lower and does fire.
+# Sizes are reported in MiB, the unit maxUploadSize itself uses.
+_MB                = 1024 * 1024
+MAX_IMSCC_BYTES    = 200 * _MB
+MAX_SYLLABUS_BYTES = 25 * _MB
+
 st.markdown('<p class="section-header">Step 1 — Upload your course export</p>', unsafe_allow_html=True)
 
 uploaded = st.file_uploader(
@@ -191,6 +237,11 @@ if uploaded is None:
     st.info("Upload a .imscc file above to get started.")
     st.stop()
 
+if uploaded.size > MAX_IMSCC_BYTES:   # safety net; see server.maxUploadSize
+    st.error(f"File too large ({uploaded.size / _MB:,.0f} MB). "
+             f"CeCe accepts course exports up to {MAX_IMSCC_BYTES // _MB} MB.")
+    st.stop()
+
 with st.expander("ℹ️ How to export your course from Canvas"):
     st.markdown("""
     1. Open your course in Canvas
@@ -211,33 +262,69 @@ syllabus_text = st.text_area(
     label_visibility="collapsed",
 )
 
+MIN_PASTED_SYLLABUS = 500   # pasted text at least this long wins over an uploaded file
+
 syl_file = st.file_uploader("Or upload syllabus (.txt, .docx, .pdf)", type=["txt", "docx", "pdf"])
-if syl_file is not None:
+if syl_file is not None and len(syllabus_text.strip()) >= MIN_PASTED_SYLLABUS:
+    st.info(f"Using the pasted syllabus text; {syl_file.name} is ignored.")
+elif syl_file is not None and syl_file.size > MAX_SYLLABUS_BYTES:
+    st.error(f"Syllabus file too large ({syl_file.size / _MB:,.0f} MB). "
+             f"Please upload a file under {MAX_SYLLABUS_BYTES // _MB} MB or paste the text above.")
+elif syl_file is not None:
     fname = syl_file.name.lower()
     try:
-        if fname.endswith(".txt"):
-            syllabus_text = syl_file.read().decode("utf-8", errors="ignore")
-        elif fname.endswith(".docx"):
-            import zipfile as _zf
-            import xml.etree.ElementTree as _ET
-            with _zf.ZipFile(io.BytesIO(syl_file.read())) as dz:
-                xml_bytes = dz.read("word/document.xml")
-            root = _ET.fromstring(xml_bytes)
-            ns = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
-            lines = []
-            for p in root.findall(".//w:p", ns):
-                text = "".join(t.text or "" for t in p.findall(".//w:t", ns)).strip()
-                if text: lines.append(text)
-            syllabus_text = "\n".join(lines)
-        elif fname.endswith(".pdf"):
-            try:
-                import pdfplumber
-                with pdfplumber.open(io.BytesIO(syl_file.read())) as pdf:
-                    syllabus_text = "\n".join(page.extract_text() or "" for page in pdf.pages).strip()
-            except ImportError:
-                import pypdf
-                reader = pypdf.PdfReader(io.BytesIO(syl_file.read()))
-                syllabus_text = "\n".join(page.extract_text() or "" for page in reader.pages).strip()
+        # Reruns keep the same upload, so reuse its parsed text rather than
+        # re-extracting a long PDF on every widget interaction.
+        parsed = st.session_state.get("syl_parsed")
+        if parsed and parsed[0] == syl_file.file_id:
+            syllabus_text = parsed[1]
+        else:
+            # Read the upload once; every parser below (and its fallbacks) works
+            # from this buffer, since a second read() on the stream returns b"".
+            syl_bytes = syl_file.getvalue()
+            if fname.endswith(".txt"):
+                syllabus_text = syl_bytes.decode("utf-8", errors="ignore")
+            elif fname.endswith(".docx"):
+                import zipfile as _zf
+                try:
+                    from lxml import etree as _ET   # C parser; same API as ElementTree here
+                    # The upload is untrusted: never resolve entities (XXE) or fetch
+                    # anything over the network. The stdlib parser takes no such options.
+                    parse_opts = {"resolve_entities": False, "no_network": True}
+                except ImportError:
+                    import xml.etree.ElementTree as _ET
+                    parse_opts = {}
+                w_p = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}p"
+                w_t = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}t"
+                lines = []
+                # One streaming pass: take each paragraph's text as it closes, then
+                # clear it so the document tree is never held in full.
+                with _zf.ZipFile(io.BytesIO(syl_bytes)) as dz, dz.open("word/document.xml") as xf:
+                    for _, el in _ET.iterparse(xf, events=("end",), **parse_opts):
+                        if el.tag == w_p:
+                            text = "".join(t.text or "" for t in el.iter(w_t)).strip()
+                            if text: lines.append(text)
+                            el.clear()
+                syllabus_text = "\n".join(lines)
+            elif fname.endswith(".pdf"):
+                # Each extractor falls through to the next when it is not installed
+                # or cannot handle this particular PDF.
+                try:
+                    import fitz   # PyMuPDF: C extractor, much faster than pdfminer-based pdfplumber
+                    with fitz.open(stream=syl_bytes, filetype="pdf") as pdf:
+                        syllabus_text = "\n".join(page.get_text("text") for page in pdf).strip()
+                except Exception:
+                    try:
+                        import pdfplumber
+                        with pdfplumber.open(io.BytesIO(syl_bytes)) as pdf:
+                            pages = [page.extract_text() or "" for page in pdf.pages]
+                            syllabus_text = "\n".join(pages).strip()
+                    except Exception:
+                        import pypdf
+                        reader = pypdf.PdfReader(io.BytesIO(syl_bytes))
+                        pages = [page.extract_text() or "" for page in reader.pages]
+                        syllabus_text = "\n".join(pages).strip()
+            st.session_state["syl_parsed"] = (syl_file.file_id, syllabus_text)
         if syllabus_text and syllabus_text.strip():
             st.success(f"✅ Extracted {len(syllabus_text):,} characters from {syl_file.name}")
         else:
@@ -257,35 +344,25 @@ run_button = st.button("🧬  Extract Course DNA", type="primary", use_container
 if not run_button and "last_result" not in st.session_state:
     st.stop()
 
-file_id = f"{uploaded.name}_{uploaded.size}_{len(syllabus_text or '')}"
+# Key results on content, not name + size: a re-export of the same course often
+# keeps both. The upload is hashed once per new upload, not on every rerun.
+upload_digest = st.session_state.get("upload_digest")
+if not upload_digest or upload_digest[0] != uploaded.file_id:
+    h = hashlib.blake2b(digest_size=16)
+    with uploaded.getbuffer() as buf:
+        h.update(buf)
+    upload_digest = (uploaded.file_id, h.hexdigest())
+    st.session_state["upload_digest"] = upload_digest
+syl_digest = hashlib.blake2b((syllabus_text or "").encode("utf-8"), digest_size=8).hexdigest()
+file_id = f"{upload_digest[1]}_{syl_digest}"
 
 if run_button or st.session_state.get("last_file_id") != file_id:
     with st.spinner("Reading course content..."):
         try:
-            from io import StringIO
-            log_capture = StringIO()
-            sys.stdout = log_capture
-
-            file_bytes = uploaded.read()
-            data = read_imscc(uploaded.name, file_bytes=file_bytes,
-                              syllabus_text=(syllabus_text or "").strip())
-            identity       = extract_course_identity(data)
-            modules        = extract_modules(data)
-            grading_groups = extract_grading_structure(data)
-            rubrics        = extract_rubrics(data)
-            document       = build_course_dna(data, identity, modules, grading_groups, rubrics)
-
-            sys.stdout = sys.__stdout__
-            log_output = log_capture.getvalue()
-
-            st.session_state["last_result"] = {
-                "document": document, "identity": identity, "modules": modules,
-                "grading_groups": grading_groups, "rubrics": rubrics,
-                "data": data, "log": log_output, "filename": uploaded.name,
-            }
+            st.session_state["last_result"] = run_pipeline(
+                file_id, uploaded.name, uploaded, (syllabus_text or "").strip())
             st.session_state["last_file_id"] = file_id
         except Exception as e:
-            sys.stdout = sys.__stdout__
             st.error(f"Extraction failed: {e}")
             with st.expander("Error details"):
                 st.code(traceback.format_exc())
@@ -297,99 +374,103 @@ result = st.session_state.get("last_result")
 if not result:
     st.stop()
 
-identity = result["identity"]
-modules  = result["modules"]
-rubrics  = result["rubrics"]
-data     = result["data"]
-stats    = data.get("publish_stats", {})
-
-st.success("✅ Extraction complete!")
-
-st.markdown('<p class="section-header">Results</p>', unsafe_allow_html=True)
-
-st.markdown(f"### {identity['title']} — {identity['code']}")
-st.caption(f"{identity['modality']} · {identity['start_date']} to {identity['end_date']}")
-
-# Stat cards
-col1, col2, col3, col4, col5 = st.columns(5)
-for col, val, label in [
-    (col1, len(modules), "Modules"),
-    (col2, stats.get("assign_published", 0), "Assignments"),
-    (col3, stats.get("wiki_published", 0), "Pages"),
-    (col4, len(rubrics), "Rubrics"),
-    (col5, len(data.get("lti_tools", [])), "LTI Tools"),
-]:
-    with col:
-        st.markdown(f'<div class="stat-card"><div class="stat-number">{val}</div>'
-                    f'<div class="stat-label">{label}</div></div>', unsafe_allow_html=True)
-
-st.markdown("")
-
-if data.get("syllabus_text"):
-    st.success(f"**Syllabus:** Included ({len(data['syllabus_text']):,} characters).")
-else:
-    st.warning("**Syllabus:** Not provided. MeMe will request it during consultation.")
+# Results render in a fragment: clicking the download button reruns only this
+# block, not the upload / syllabus / extract steps above it.
+@st.fragment
+def show_results(result):
+    identity = result["identity"]
+    modules  = result["modules"]
+    rubrics  = result["rubrics"]
+    stats    = result["stats"]
+
+    st.success("✅ Extraction complete!")
+
+    st.markdown('<p class="section-header">Results</p>', unsafe_allow_html=True)
+
+    st.markdown(f"### {identity['title']} — {identity['code']}")
+    st.caption(f"{identity['modality']} · {identity['start_date']} to {identity['end_date']}")
+
+    # Stat cards: one flex row in a single element instead of five columns
+    cards = "".join(
+        f'<div class="stat-card"><div class="stat-number">{val}</div>'
+        f'<div class="stat-label">{label}</div></div>'
+        for val, label in [
+            (len(modules), "Modules"),
+            (stats.get("assign_published", 0), "Assignments"),
+            (stats.get("wiki_published", 0), "Pages"),
+            (len(rubrics), "Rubrics"),
+            (len(result["lti_tools"]), "LTI Tools"),
+        ])
+    st.markdown(f'<div class="stat-row">{cards}</div>', unsafe_allow_html=True)
+
+    st.markdown("")
+
+    if result["syllabus_text"]:
+        st.success(f"**Syllabus:** Included ({len(result['syllabus_text']):,} characters).")
+    else:
+        st.warning("**Syllabus:** Not provided. MeMe will request it during consultation.")
 
-unpub = stats.get("assign_unpublished", 0) + stats.get("wiki_unpublished", 0)
-if unpub > 0:
-    st.info(f"ℹ️ **{unpub} item(s)** were unpublished and excluded from the Course DNA Document.")
+    unpub = stats.get("assign_unpublished", 0) + stats.get("wiki_unpublished", 0)
+    if unpub > 0:
+        st.info(f"ℹ️ **{unpub} item(s)** were unpublished and excluded from the Course DNA Document.")
 
-if not rubrics:
-    st.warning("⚠️ **No rubrics found.** MeMe will flag this for QM Standard 3.3.")
+    if not rubrics:
+        st.warning("⚠️ **No rubrics found.** MeMe will flag this for QM Standard 3.3.")
 
 
-# ── Step 4: Download ────────────────────────────────────────────
-st.markdown('<p class="section-header">Step 4 — Download & consult with MeMe</p>', unsafe_allow_html=True)
+    # ── Step 4: Download ────────────────────────────────────────
+    st.markdown('<p class="section-header">Step 4 — Download & consult with MeMe</p>', unsafe_allow_html=True)
 
-base_name = os.path.splitext(result["filename"])[0]
+    base_name = os.path.splitext(result["filename"])[0]
 
-st.download_button(
-    label="⬇  Download Course DNA Document (.md)",
-    data=result["document"].encode("utf-8"),
-    file_name=f"{base_name}_dna.md",
-    mime="text/markdown",
-    use_container_width=True,
-)
+    st.download_button(
+        label="⬇  Download Course DNA Document (.md)",
+        data=result["document_bytes"],
+        file_name=f"{base_name}_dna.md",
+        mime="text/markdown",
+        use_container_width=True,
+    )
 
-st.markdown("""
-**After downloading:**
-1. Open the `.md` file in any text editor
-2. Select all (Ctrl+A / Cmd+A) and copy
-3. Paste into your MeMe consultation (Claude, ChatGPT, or Gemini)
-4. MeMe will conduct a full QM needs analysis and guide you through remediation
-""")
+    st.markdown("""
+    **After downloading:**
+    1. Open the `.md` file in any text editor
+    2. Select all (Ctrl+A / Cmd+A) and copy
+    3. Paste into your MeMe consultation (Claude, ChatGPT, or Gemini)
+    4. MeMe will conduct a full QM needs analysis and guide you through remediation
+    """)
 
 
-# ── Expanders ───────────────────────────────────────────────────
-with st.expander("🔍 Preview the Course DNA Document"):
-    st.markdown(result["document"][:8000] + "\n\n*[truncated for preview — download for full document]*")
+    # ── Expanders ───────────────────────────────────────────────
+    with st.expander("🔍 Preview the Course DNA Document"):
+        # Shown as source: no markdown parse/sanitize pass over 8 KB on each expander render.
+        st.code(result["preview"] + "\n\n[truncated for preview — download for full document]",
+                language="markdown")
 
-with st.expander("📋 Extraction log"):
-    st.code(result["log"], language=None)
+    with st.expander("📋 Extraction log"):
+        st.code(result["log"], language=None)
 
-with st.expander("🔬 Rubric XML diagnostic"):
-    raw_xml = data.get("rubrics", "")
-    if not raw_xml:
-        st.warning("No rubrics.xml found in the IMSCC export.")
-    else:
-        st.markdown(f"**Raw rubrics.xml:** {len(raw_xml):,} characters")
-        import re as _re
-        _clean = _re.sub(r'\sxmlns(?::\w+)?\s*=\s*["\'][^"\']*["\']', '', raw_xml)
-        _clean = _re.sub(r'\s\w+:\w+\s*=\s*["\'][^"\']*["\']', '', _clean)
-        _clean = _re.sub(r'<(/?)[\w]+:', r'<\1', _clean)
-        try:
-            import xml.etree.ElementTree as _ET
-            _root = _ET.fromstring(_clean)
-            st.markdown(f"**Root tag:** `{_root.tag}`")
-            all_tags = sorted(set(el.tag for el in _root.iter()))
-            st.markdown(f"**All tags ({len(all_tags)}):** {', '.join(all_tags)}")
-            for tag in ['rubric', 'criterion', 'rating', 'criteria', 'ratings']:
-                found = _root.findall(f'.//{tag}')
-                st.markdown(f"- `.//{tag}`: **{len(found)}**")
-        except Exception as _e:
-            st.error(f"XML parse error: {_e}")
-        st.markdown("**First 500 chars:**")
-        st.code(raw_xml[:500], language="xml")
+    with st.expander("🔬 Rubric XML diagnostic"):
+        raw_xml = result["rubrics_xml"]
+        if not raw_xml:
+            st.warning("No rubrics.xml found in the IMSCC export.")
+        else:
+            st.markdown(f"**Raw rubrics.xml:** {len(raw_xml):,} characters")
+            try:
+                import xml.etree.ElementTree as _ET
+                _root = _ET.fromstring(strip_xml_namespaces(raw_xml))
+                st.markdown(f"**Root tag:** `{_root.tag}`")
+                all_tags = sorted(set(el.tag for el in _root.iter()))
+                st.markdown(f"**All tags ({len(all_tags)}):** {', '.join(all_tags)}")
+                for tag in ['rubric', 'criterion', 'rating', 'criteria', 'ratings']:
+                    found = _root.findall(f'.//{tag}')
+                    st.markdown(f"- `.//{tag}`: **{len(found)}**")
+            except Exception as _e:
+                st.error(f"XML parse error: {_e}")
+            st.markdown("**First 500 chars:**")
+            st.code(raw_xml[:500], language="xml")
+
+
+show_results(result)
 
 
 # ── Footer ──────────────────────────────────────────────────────